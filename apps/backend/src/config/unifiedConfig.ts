@@ -27,6 +27,7 @@ export interface UnifiedConfig {
     timeout: number; // milliseconds for move analysis
     initTimeout: number; // milliseconds for engine initialization
     poolSize: number; // number of engine instances in the pool
+    moveCacheSize: number; // max cached (position, depth) analysis results
   };
   cors: {
     origin: string;
@@ -70,6 +71,10 @@ export const config: UnifiedConfig = {
     timeout: parseInt(process.env.ENGINE_TIMEOUT || '30000', 10), // 30 seconds default
     initTimeout: parseInt(process.env.ENGINE_INIT_TIMEOUT || '10000', 10), // 10 seconds default
     poolSize: Math.max(1, Math.min(10, parseInt(process.env.ENGINE_POOL_SIZE || '2', 10))), // 1-10 engines
+    moveCacheSize: Math.max(
+      0,
+      Math.min(10000, parseInt(process.env.ENGINE_MOVE_CACHE_SIZE || '500', 10))
+    ), // 0 disables caching
   },
   cors: {
     origin: process.env.CORS_ORIGIN || 'http://localhost:3000',
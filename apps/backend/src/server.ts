@@ -12,6 +12,10 @@ async function startServer(): Promise<void> {
   // Connect to database with retry logic
   await connectWithRetry();
 
+  // Warm the engine pool in the background so the first move request
+  // doesn't pay Stockfish initialization cost
+  void services.engineService.warmup();
+
   const server = app.listen(PORT, () => {
     // eslint-disable-next-line no-console
     console.log(`Server running on port ${PORT}`);
@@ -22,6 +22,7 @@ jest.mock('../../config/unifiedConfig', () => ({
     engine: {
       timeout: 30000,
       initTimeout: 10000,
+      moveCacheSize: 500,
     },
   },
 }));
@@ -203,6 +204,55 @@ describe('EngineService', () => {
       }
     });
 
+    it('should serve repeated position/depth from the analysis cache', async () => {
+      mockEngine.isReady.mockReturnValueOnce(false).mockReturnValue(true);
+
+      const first = await engineService.getEngineMove(mockFen, 3, []);
+      const second = await engineService.getEngineMove(mockFen, 3, []);
+
+      expect(mockEngine.getBestMove).toHaveBeenCalledTimes(1);
+      expect(second).toEqual(first);
+    });
+
+    it('should not share cached analysis across depths', async () => {
+      mockEngine.isReady.mockReturnValueOnce(false).mockReturnValue(true);
+
+      await engineService.getEngineMove(mockFen, 3, []);
+      await engineService.getEngineMove(mockFen, 4, []);
+
+      expect(mockEngine.getBestMove).toHaveBeenCalledTimes(2);
+    });
+
+    it('should clear the analysis cache when switching providers', async () => {
+      mockEngine.isReady.mockReturnValueOnce(false).mockReturnValue(true);
+
+      await engineService.getEngineMove(mockFen, 3, []);
+
+      const newEngine: ChessEngine = {
+        name: 'new',
+        initialize: jest.fn().mockResolvedValue(undefined),
+        getBestMove: jest.fn().mockResolvedValue({
+          move: { from: 'g8', to: 'f6' },
+          depth: 5,
+        }),
+        dispose: jest.fn().mockResolvedValue(undefined),
+        isReady: jest.fn().mockReturnValue(true),
+      };
+      const newProvider: EngineProvider = {
+        name: 'new-engine',
+        description: 'New engine',
+        createEngine: jest.fn().mockReturnValue(newEngine),
+      };
+
+      engineService.registerProvider(newProvider);
+      await engineService.switchProvider('new-engine');
+
+      const result = await engineService.getEngineMove(mockFen, 3, []);
+
+      expect(newEngine.getBestMove).toHaveBeenCalledTimes(1);
+      expect(result.move.from).toBe('g8');
+    });
+
     it('should throw error when engine fails to initialize', async () => {
       mockEngine.initialize.mockRejectedValue(new Error('Init failed'));
       mockEngine.isReady.mockReturnValue(false);
@@ -211,6 +261,23 @@ describe('EngineService', () => {
     });
   });
 
+  describe('warmup', () => {
+    it('should initialize the engine pool eagerly', async () => {
+      mockEngine.isReady.mockReturnValue(true);
+
+      await engineService.warmup();
+
+      expect(mockEngine.initialize).toHaveBeenCalled();
+      expect(engineService.isReady()).toBe(true);
+    });
+
+    it('should not throw when initialization fails', async () => {
+      mockEngine.initialize.mockRejectedValue(new Error('Init failed'));
+
+      await expect(engineService.warmup()).resolves.not.toThrow();
+    });
+  });
+
   describe('isReady', () => {
     it('should return false when engine not initialized', () => {
       expect(engineService.isReady()).toBe(false);
@@ -9,6 +9,7 @@ import type {
 import { stockfishProvider } from '../engines/StockfishEngine';
 import { EnginePool } from '../engines/EnginePool';
 import { DefaultPlayStyle } from '../engines/styles/DefaultPlayStyle';
+import { LruCache } from '../utils/LruCache';
 import { config } from '../config/unifiedConfig';
 
 /**
@@ -27,8 +28,16 @@ export class EngineService {
   private currentProvider = 'stockfish';
   private initializationPromise: Promise<void> | null = null;
 
+  // Stockfish at a fixed depth is deterministic for a given position, so
+  // repeated positions (openings especially) can skip analysis entirely.
+  private analysisCache: LruCache<EngineResult> | null;
+
   constructor(playStyle?: PlayStyleStrategy) {
     this.playStyle = playStyle || new DefaultPlayStyle();
+    this.analysisCache =
+      config.engine.moveCacheSize > 0
+        ? new LruCache<EngineResult>(config.engine.moveCacheSize)
+        : null;
 
     // Register default providers
     this.registerProvider(stockfishProvider);
@@ -77,6 +86,9 @@ export class EngineService {
 
     this.currentProvider = providerName;
 
+    // Cached analyses came from the previous engine
+    this.analysisCache?.clear();
+
     Sentry.addBreadcrumb({
       message: `Switched to engine provider: ${providerName}`,
       category: 'engine',
@@ -116,6 +128,24 @@ export class EngineService {
     await this.enginePool.initialize();
   }
 
+  /**
+   * Eagerly initialize the engine pool so the first move request does not
+   * pay engine startup cost. Best-effort: failures are reported to Sentry
+   * and initialization is retried by the next getEngineMove call.
+   */
+  async warmup(): Promise<void> {
+    try {
+      await this.ensureInitialized();
+
+      Sentry.addBreadcrumb({
+        message: 'Engine pool warmed up',
+        category: 'engine',
+      });
+    } catch (error) {
+      Sentry.captureException(error, { extra: { context: 'engine pool warmup' } });
+    }
+  }
+
   /**
    * Get the best move for a position
    *
@@ -168,6 +198,19 @@ export class EngineService {
     // Allow play style to modify config
     const engineConfig = this.playStyle.modifyConfig(baseConfig);
 
+    // Identical position + depth yields an identical analysis, so serve
+    // repeated positions from the cache without touching the pool
+    const cacheKey = `${fen}:${engineConfig.depth}`;
+    const cached = this.analysisCache?.get(cacheKey);
+    if (cached) {
+      Sentry.addBreadcrumb({
+        message: 'Engine move served from analysis cache',
+        category: 'engine',
+        data: { depth: engineConfig.depth, cacheSize: this.analysisCache?.size },
+      });
+      return cached;
+    }
+
     // Acquire an engine from the pool
     const engine = await this.enginePool.acquire();
 
@@ -185,6 +228,8 @@ export class EngineService {
         },
       });
 
+      this.analysisCache?.set(cacheKey, result);
+
       return result;
     } finally {
       // Always release the engine back to the pool
@@ -203,6 +248,8 @@ export class EngineService {
    * Dispose of all engine resources
    */
   async dispose(): Promise<void> {
+    this.analysisCache?.clear();
+
     if (this.enginePool) {
       await this.enginePool.disposeAll();
       this.enginePool = null;
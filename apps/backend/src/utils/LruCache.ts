@@ -0,0 +1,64 @@
+/**
+ * Simple bounded LRU cache backed by Map insertion order.
+ * Used to memoize deterministic engine analysis results.
+ */
+export class LruCache<V> {
+  private entries = new Map<string, V>();
+  private maxSize: number;
+
+  constructor(maxSize: number) {
+    this.maxSize = Math.max(1, maxSize);
+  }
+
+  /**
+   * Returns the cached value for a key, marking it as most recently used.
+   */
+  get(key: string): V | undefined {
+    const value = this.entries.get(key);
+    if (value === undefined) {
+      return undefined;
+    }
+
+    // Re-insert to move the key to the most-recently-used position
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  /**
+   * Stores a value, evicting the least recently used entry when full.
+   */
+  set(key: string, value: V): void {
+    if (this.entries.has(key)) {
+      this.entries.delete(key);
+    } else if (this.entries.size >= this.maxSize) {
+      // Map iteration order is insertion order, so the first key is the LRU
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) {
+        this.entries.delete(oldest);
+      }
+    }
+    this.entries.set(key, value);
+  }
+
+  /**
+   * Checks whether a key is cached (without affecting recency).
+   */
+  has(key: string): boolean {
+    return this.entries.has(key);
+  }
+
+  /**
+   * Removes all cached entries.
+   */
+  clear(): void {
+    this.entries.clear();
+  }
+
+  /**
+   * Returns the number of cached entries.
+   */
+  get size(): number {
+    return this.entries.size;
+  }
+}